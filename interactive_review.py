@@ -0,0 +1,735 @@
+#!/usr/bin/env python3
+"""Interactively walk through BAD findings from an auto_code_review.md report.
+
+The pre-commit hook writes its review to auto_code_review.md in the repository
+root. This script parses that report, keeps per-finding progress in a small
+JSON state file next to the review, and lets you step through each BAD finding
+to inspect the code, open it in an editor, apply the suggested patch, or hand
+the finding to the Gemini/Cursor CLI for an automatic fix.
+
+Usage:
+    python3 interactive_review.py [path/to/auto_code_review.md]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import hashlib
+import io
+import itertools
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from review_parsing import ASSESSMENT_MARKER
+
+REVIEW_FILENAME = "auto_code_review.md"
+STATE_FILENAME = ".auto_code_review_state.json"
+
+# orjson is noticeably faster than stdlib json for the small state dicts
+# written between interactive prompts; fall back silently when absent.
+try:
+    import orjson
+
+    def _dumps(state: Dict) -> bytes:
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+
+    def _loads(data: bytes) -> Dict:
+        return orjson.loads(data)
+
+except ImportError:
+
+    def _dumps(state: Dict) -> bytes:
+        return (json.dumps(state, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+    def _loads(data: bytes) -> Dict:
+        return json.loads(data)
+
+# Compiled once at import so per-finding parsing does not pay regex-cache
+# lookups or recompilation.
+_SECTION_RE = re.compile(
+    r"## Change-by-Change Review\s*\n(?P<section>.*?)(?=\n## |\Z)", re.S
+)
+# Shared with interactive_review_helper via review_parsing so the review
+# format is defined in one place.
+_ASSESSMENT_MARKER = ASSESSMENT_MARKER
+_PATCH_BLOCK_RE = re.compile(r"```(?:diff|patch|suggestion)?\n(.*?)```", re.S)
+
+
+_UNSET = object()
+
+
+@dataclass(slots=True)
+class Finding:
+    """One BAD assessment block from the review report."""
+
+    title: str
+    file: str
+    function: str
+    lines: str
+    details: str
+    suggestion: str
+    reasoning: str
+    raw_block: str
+    # Memoized derived values; parsed once per finding instead of on every
+    # keystroke branch that needs them.
+    _line_span: object = field(default=_UNSET, repr=False, compare=False)
+    _resolved_path: object = field(default=_UNSET, repr=False, compare=False)
+
+    @property
+    def identifier(self) -> str:
+        return f"{self.file}::{self.lines}::{self.title}"
+
+    def line_span(self) -> Optional[Tuple[int, int]]:
+        if self._line_span is _UNSET:
+            self._line_span = parse_line_span(self.lines)
+        return self._line_span
+
+    def resolved_path(self, repo_root: Path) -> Path:
+        if self._resolved_path is _UNSET:
+            self._resolved_path = repo_root / self.file if self.file else repo_root
+        return self._resolved_path
+
+
+@functools.lru_cache(maxsize=1)
+def find_repo_root() -> Path:
+    """Return the git repository root, falling back to the current directory.
+
+    The root cannot change during a session, so the subprocess runs once.
+    """
+    result = subprocess.run(
+        [resolve_command("git") or "git", "rev-parse", "--show-toplevel"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode == 0 and result.stdout.strip():
+        return Path(result.stdout.strip())
+    return Path.cwd()
+
+
+def _iter_review_files(directory: str):
+    """Yield (path, mtime) for review files, pruning hidden dirs at descent."""
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_review_files(entry.path)
+                elif entry.name == REVIEW_FILENAME:
+                    yield entry.path, entry.stat().st_mtime
+            except OSError:
+                continue
+
+
+def find_latest_review(repo_root: Path) -> Optional[Path]:
+    """Locate the most recently modified auto_code_review.md under the repo."""
+    best_path: Optional[str] = None
+    best_mtime = -1.0
+    for path, mtime in _iter_review_files(str(repo_root)):
+        if mtime > best_mtime:
+            best_path, best_mtime = path, mtime
+    return Path(best_path) if best_path is not None else None
+
+
+_LABEL_PAREN_RE = re.compile(r"\s*\(if ['\"]?bad['\"]?\)\s*", re.IGNORECASE)
+_LABEL_ALIASES = {
+    "title": "title",
+    "file": "file",
+    "function": "function",
+    "lines": "lines",
+    "line": "lines",
+    "details": "details",
+    "detail": "details",
+    "suggestion": "suggestion",
+    "reasoning": "reasoning",
+}
+
+
+def canonicalize_label(label: str) -> str:
+    """Map a bold field label from the report onto a Finding attribute name."""
+    normalized = label.strip().lower()
+    # Labels without a parenthetical (the common case) skip the substitution.
+    if "(" in normalized:
+        normalized = _LABEL_PAREN_RE.sub("", normalized)
+    normalized = normalized.rstrip(":").strip()
+    return _LABEL_ALIASES.get(normalized, normalized)
+
+
+def clean_value(raw_line: str) -> str:
+    """Strip markdown artifacts (trailing backslash line-breaks) from a value."""
+    return raw_line.strip().rstrip("\\").strip()
+
+
+def parse_fields(body: str) -> Dict[str, str]:
+    """Parse the ``**label:** value`` lines of one assessment block.
+
+    Prose lines are cleaned of markdown artifacts, but everything inside a
+    ``` fence is kept verbatim: a suggested diff's context-line spaces,
+    indentation and blank lines are significant, and stripping them corrupts
+    the patch for git apply.
+    """
+    fields: Dict[str, List[str]] = {}
+    bucket: Optional[List[str]] = None
+    in_fence = False
+    for raw_line in body.splitlines():
+        stripped = raw_line.strip()
+        if in_fence:
+            if bucket is not None:
+                bucket.append(raw_line)
+            if stripped.startswith("```"):
+                in_fence = False
+            continue
+        if stripped.startswith("```"):
+            in_fence = True
+            if bucket is not None:
+                bucket.append(clean_value(raw_line))
+            continue
+        if stripped.startswith("**"):
+            closing = stripped.find("**", 2)
+            if closing != -1:
+                current_field = canonicalize_label(stripped[2:closing])
+                bucket = fields.get(current_field)
+                if bucket is None:
+                    bucket = fields[current_field] = []
+                value = clean_value(stripped[closing + 2 :].lstrip(":"))
+                if value:
+                    bucket.append(value)
+                continue
+        if bucket is not None and stripped:
+            bucket.append(clean_value(raw_line))
+    return {name: "\n".join(value) for name, value in fields.items()}
+
+
+def parse_bad_findings(review_text: str) -> List[Finding]:
+    """Extract every BAD assessment block from the review report."""
+    section_match = _SECTION_RE.search(review_text)
+    if not section_match:
+        return []
+    section = section_match.group("section")
+    # All-GOOD reviews are the common case after a few fix rounds; a substring
+    # scan is far cheaper than the DOTALL assessment walk below.
+    if "BAD" not in section:
+        return []
+    findings: List[Finding] = []
+    # A linear split/partition walk; the old lookahead regex backtracked per
+    # assessment on large reviews.
+    for chunk in section.split(_ASSESSMENT_MARKER)[1:]:
+        grade_line, _, body = chunk.partition("\n")
+        grade_tokens = grade_line.strip().split(None, 1)
+        if not grade_tokens or grade_tokens[0].upper() != "BAD":
+            continue
+        cut = body.find("\n## ")
+        if cut != -1:
+            body = body[:cut]
+        fields = parse_fields(body)
+        findings.append(
+            Finding(
+                title=fields.get("title", "(untitled)"),
+                file=fields.get("file", ""),
+                function=fields.get("function", ""),
+                lines=fields.get("lines", ""),
+                details=fields.get("details", ""),
+                suggestion=fields.get("suggestion", ""),
+                reasoning=fields.get("reasoning", ""),
+                raw_block=f"{_ASSESSMENT_MARKER}{grade_line}\n{body}",
+            )
+        )
+    return findings
+
+
+def parse_line_span(line_text: str) -> Optional[Tuple[int, int]]:
+    """Parse a ``10`` or ``10-15`` span from the Lines field.
+
+    The inputs are tiny, so plain str methods beat a regex here.
+    """
+    if not line_text:
+        return None
+    head, _, tail = line_text.strip().strip("'\"`").partition("-")
+    head = head.strip()
+    tail = tail.strip()
+    if not head.isdigit():
+        return None
+    start = int(head)
+    end = int(tail) if tail.isdigit() else start
+    if end < start:
+        start, end = end, start
+    return start, end
+
+
+def extract_patch(ai_output: str) -> Optional[str]:
+    """Pull the first fenced diff/patch block out of a markdown blob."""
+    if "```" not in ai_output:
+        return None
+    match = _PATCH_BLOCK_RE.search(ai_output)
+    if not match:
+        return None
+    patch = match.group(1)
+    return patch if patch.strip() else None
+
+
+def prepare_patch_for_application(patch_text: str) -> Optional[str]:
+    """Normalize a suggested patch and check it looks like a unified diff."""
+    normalized = patch_text.strip("\n")
+    if not normalized:
+        return None
+    if not normalized.endswith("\n"):
+        normalized += "\n"
+    # One linear pass instead of three full regex scans; real diffs satisfy
+    # all three checks within their first few lines.
+    has_minus = has_plus = has_hunk = False
+    for line in normalized.split("\n"):
+        if line.startswith("--- "):
+            has_minus = True
+        elif line.startswith("+++ "):
+            has_plus = True
+        elif line.startswith("@@ "):
+            has_hunk = True
+        if has_minus and has_plus and has_hunk:
+            break
+    if not (has_minus and has_plus and has_hunk):
+        return None
+    return normalized
+
+
+@functools.lru_cache(maxsize=128)
+def resolve_command(name: str) -> Optional[str]:
+    """Return the absolute path of *name* if it is on PATH.
+
+    Results (including misses) are cached for the session; PATH is not
+    expected to change underneath us. Call ``resolve_command.cache_clear()``
+    if it does.
+    """
+    return shutil.which(name)
+
+
+def render_file_snippet(
+    file_path: Path,
+    start_line: Optional[int],
+    end_line: Optional[int],
+    context: int = 3,
+) -> str:
+    """Render a numbered excerpt of *file_path* around the finding's lines."""
+    if not file_path.is_file():
+        return f"(file not found: {file_path})"
+    if start_line is None or end_line is None:
+        snippet_start, snippet_end = 1, 40
+    else:
+        snippet_start = max(1, start_line - context)
+        snippet_end = end_line + context
+    # Only the requested window pays decode/allocation cost; the rest of the
+    # file is never materialized.
+    with file_path.open("r", encoding="utf-8", errors="replace") as handle:
+        window = enumerate(
+            itertools.islice(handle, snippet_start - 1, snippet_end),
+            start=snippet_start,
+        )
+        return "\n".join(f"{idx:>5}: {line.rstrip()}" for idx, line in window)
+
+
+# Ceiling on the snippet / raw-block sections of the fix prompt; pathological
+# review blocks should not balloon the CLI's stdin.
+_PROMPT_SECTION_LIMIT = 64 * 1024
+
+
+def build_fix_prompt(finding: Finding, repo_root: Path) -> str:
+    """Build the prompt handed to the AI CLI when fixing one finding."""
+    span = finding.line_span()
+    file_path = finding.resolved_path(repo_root)
+    if span:
+        snippet = render_file_snippet(file_path, span[0], span[1])
+    else:
+        snippet = render_file_snippet(file_path, None, None)
+
+    buf = io.StringIO()
+    write = buf.write
+    write(
+        "You are fixing a single code review finding. "
+        "Edit the file directly and keep the change minimal.\n\n"
+    )
+    write(
+        f"File: {finding.file}\nFunction: {finding.function}\n"
+        f"Lines: {finding.lines}\n\n"
+    )
+    write(f"Problem:\n{finding.details}\n\n")
+    if finding.suggestion:
+        write(f"Suggested change:\n{finding.suggestion}\n\n")
+    if finding.reasoning:
+        write(f"Reasoning:\n{finding.reasoning}\n\n")
+    write(
+        "Current file excerpt (line numbers added):\n"
+        f"```text\n{snippet[:_PROMPT_SECTION_LIMIT]}\n```\n\n"
+    )
+    write(
+        f"Full review block for reference:\n{finding.raw_block[:_PROMPT_SECTION_LIMIT]}\n\n"
+    )
+    write("Do not touch unrelated code. Answer with a short summary of the edit.")
+    return buf.getvalue()
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_ai_cli() -> Optional[Tuple[str, ...]]:
+    """Pick the AI CLI argv once per session, preferring Gemini over Cursor."""
+    gemini = resolve_command("gemini")
+    if gemini:
+        return (gemini, "--approval-mode", "auto_edit", "-m", "gemini-2.5-pro")
+    cursor = resolve_command("cursor-agent")
+    if cursor:
+        return (cursor, "-f", "--output-format", "text")
+    return None
+
+
+def build_command() -> Optional[List[str]]:
+    """Return the AI CLI command line, or None when no CLI is installed."""
+    command = _discover_ai_cli()
+    return list(command) if command else None
+
+
+def run_ai_fix(finding: Finding, repo_root: Path) -> Optional[str]:
+    """Run the AI CLI on one finding; returns its stdout, or None on failure."""
+    command = _discover_ai_cli()
+    if command is None:
+        print("No supported AI CLI found (gemini, cursor-agent).")
+        return None
+    prompt = build_fix_prompt(finding, repo_root)
+    result = subprocess.run(
+        command,
+        input=prompt,
+        capture_output=True,
+        text=True,
+        cwd=repo_root,
+        shell=False,
+        check=False,
+    )
+    if result.returncode != 0:
+        print(f"AI CLI exited with {result.returncode}:")
+        print(result.stderr.strip())
+        return None
+    return result.stdout
+
+
+def powershell_quote(text: str) -> str:
+    return "'" + text.replace("'", "''") + "'"
+
+
+# Dedented once at import; the hot 'f' path only pays str.format.
+_PS_SCRIPT_TEMPLATE = textwrap.dedent(
+    """\
+    Get-Content -Raw {output_path_quoted} | Out-Host
+    Read-Host 'Press Enter to close'
+    Remove-Item {output_path_quoted}
+    """
+).strip()
+_BASH_SCRIPT_TEMPLATE = textwrap.dedent(
+    """\
+    less -R {output_quoted}
+    rm -f {output_quoted}
+    """
+).strip()
+
+
+def show_text_in_new_terminal(title: str, text: str) -> bool:
+    """Display *text* in a new terminal window; returns False if none opened."""
+    handle = tempfile.NamedTemporaryFile(
+        "w", suffix=".txt", prefix="code_review_", delete=False, encoding="utf-8"
+    )
+    with handle:
+        handle.write(f"{title}\n{'=' * len(title)}\n\n{text}\n")
+    output_path = handle.name
+
+    if os.name == "nt":
+        script = _PS_SCRIPT_TEMPLATE.format(
+            output_path_quoted=powershell_quote(output_path)
+        )
+        subprocess.Popen(
+            ["powershell", "-NoProfile", "-Command", script],
+            creationflags=getattr(subprocess, "CREATE_NEW_CONSOLE", 0),
+        )
+        return True
+
+    output_quoted = "'" + output_path.replace("'", "'\\''") + "'"
+    script = _BASH_SCRIPT_TEMPLATE.format(output_quoted=output_quoted)
+    terminal_candidates = [
+        ("x-terminal-emulator", ["-e"]),
+        ("gnome-terminal", ["--"]),
+        ("konsole", ["-e"]),
+        ("xfce4-terminal", ["-x"]),
+        ("mate-terminal", ["-x"]),
+        ("tilix", ["-e"]),
+        ("kitty", []),
+        ("alacritty", ["-e"]),
+        ("urxvt", ["-e"]),
+        ("xterm", ["-e"]),
+    ]
+    for terminal, args in terminal_candidates:
+        if resolve_command(terminal):
+            subprocess.Popen(
+                [terminal, *args, "bash", "-c", script],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            return True
+    return False
+
+
+def state_path_for(review_path: Path) -> Path:
+    return review_path.parent / STATE_FILENAME
+
+
+def load_state(state_path: Path) -> Dict:
+    """Load the per-finding progress state; missing or broken files reset it.
+
+    A single read_bytes avoids the separate exists() stat, and json.loads on
+    bytes skips text-handle codec buffering.
+    """
+    try:
+        data = state_path.read_bytes()
+    except OSError:
+        return {}
+    try:
+        return _loads(data)
+    except ValueError:
+        return {}
+
+
+_last_state_digest: Optional[bytes] = None
+
+
+def save_state(state_path: Path, state: Dict) -> None:
+    """Persist the state dict next to the review file.
+
+    The interactive loop saves after most commands; when nothing actually
+    changed since the last write the serialization digest matches and the
+    disk write is skipped entirely.
+    """
+    global _last_state_digest
+    payload = _dumps(state)
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    if digest == _last_state_digest:
+        return
+    tmp_path = state_path.with_suffix(state_path.suffix + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, state_path)
+    _last_state_digest = digest
+
+
+def ensure_state_for_findings(state: Dict, findings: List[Finding]) -> None:
+    """Sync state entries with the current findings, dropping stale ones."""
+    finding_ids = frozenset(finding.identifier for finding in findings)
+    existing = state.get("findings", {})
+    state["findings"] = {
+        key: value for key, value in existing.items() if key in finding_ids
+    }
+    for finding in findings:
+        if finding.identifier not in state["findings"]:
+            state["findings"][finding.identifier] = {"status": "pending"}
+
+
+def open_in_editor(finding: Finding, repo_root: Path) -> None:
+    editor = os.environ.get("EDITOR") or "vi"
+    if not resolve_command(editor.split()[0]):
+        print(f"Editor not found: {editor}")
+        return
+    command = editor.split()
+    span = finding.line_span()
+    if span and command[0].rsplit("/", 1)[-1] in ("vi", "vim", "nvim", "nano"):
+        command.append(f"+{span[0]}")
+    command.append(str(finding.resolved_path(repo_root)))
+    subprocess.run(command, check=False)
+
+
+def display_finding(index: int, total: int, finding: Finding, status: str) -> None:
+    print()
+    print(f"[{index}/{total}] {finding.title}  ({status})")
+    print(f"  file:     {finding.file}")
+    print(f"  function: {finding.function}")
+    print(f"  lines:    {finding.lines}")
+    print(f"  details:  {finding.details}")
+    if finding.suggestion:
+        print(f"  suggestion:\n{textwrap.indent(finding.suggestion, '    ')}")
+
+
+def apply_patch(finding: Finding, repo_root: Path) -> bool:
+    """Apply the finding's suggested patch with git apply; returns success."""
+    # raw_block first: it is the pristine review text (its first fence is the
+    # suggestion's fence), so any parsing artifact in the field cannot leak
+    # into the patch. postprocess_review extracts from the block for the same
+    # reason.
+    patch = extract_patch(finding.raw_block) or extract_patch(finding.suggestion)
+    if patch is None:
+        print("No fenced patch found in this finding.")
+        return False
+    prepared = prepare_patch_for_application(patch)
+    if prepared is None:
+        print("Suggested patch is not a unified diff; cannot apply automatically.")
+        return False
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".patch", delete=False, encoding="utf-8"
+    ) as handle:
+        handle.write(prepared)
+        patch_path = handle.name
+    try:
+        result = subprocess.run(
+            ["git", "apply", "--verbose", patch_path],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    finally:
+        os.unlink(patch_path)
+    if result.returncode != 0:
+        print("git apply failed:")
+        print(result.stderr.strip())
+        return False
+    print("Patch applied.")
+    return True
+
+
+HELP_TEXT = """\
+Commands:
+  n  next finding          p  show suggested patch
+  o  open file in editor   v  view file excerpt
+  f  fix with AI CLI       a  apply suggested patch
+  s  mark skipped          d  mark done
+  q  quit (progress is saved)"""
+
+
+def interactive_loop(
+    findings: List[Finding],
+    state: Dict,
+    state_path: Path,
+    repo_root: Path,
+    autosave_every: int = 10,
+) -> None:
+    total = len(findings)
+    index = 0
+    actions_since_save = 0
+    # ensure_state_for_findings has run, so every finding has an entry here;
+    # bind the dict once instead of re-fetching it per iteration.
+    findings_state = state["findings"]
+    # State lives in memory and is flushed on exit (including Ctrl-C) plus
+    # every autosave_every state-changing actions for crash-safety, instead
+    # of one disk write per keystroke.
+    try:
+        while index < len(findings):
+            finding = findings[index]
+            entry = findings_state[finding.identifier]
+            display_finding(index + 1, total, finding, entry.get("status", "pending"))
+            try:
+                choice = input("> ").strip().lower()
+            except EOFError:
+                print()
+                break
+            if choice == "n":
+                index += 1
+            elif choice == "p":
+                patch = extract_patch(finding.raw_block) or extract_patch(
+                    finding.suggestion
+                )
+                print(patch if patch else "(no fenced patch in this finding)")
+            elif choice == "o":
+                open_in_editor(finding, repo_root)
+            elif choice == "v":
+                span = finding.line_span()
+                file_path = finding.resolved_path(repo_root)
+                if span:
+                    print(render_file_snippet(file_path, span[0], span[1]))
+                else:
+                    print(render_file_snippet(file_path, None, None))
+            elif choice == "f":
+                output = run_ai_fix(finding, repo_root)
+                if output is not None:
+                    entry["status"] = "ai_fixed"
+                    actions_since_save += 1
+                    if not show_text_in_new_terminal("AI fix output", output):
+                        print(output)
+            elif choice == "a":
+                if apply_patch(finding, repo_root):
+                    entry["status"] = "applied"
+                    index += 1
+                else:
+                    entry["status"] = "apply_failed"
+                actions_since_save += 1
+            elif choice == "s":
+                entry["status"] = "skipped"
+                actions_since_save += 1
+                index += 1
+            elif choice == "d":
+                entry["status"] = "done"
+                actions_since_save += 1
+                index += 1
+            elif choice == "q":
+                break
+            else:
+                print(HELP_TEXT)
+            if autosave_every > 0 and actions_since_save >= autosave_every:
+                save_state(state_path, state)
+                actions_since_save = 0
+    finally:
+        save_state(state_path, state)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Interactively triage BAD findings from auto_code_review.md."
+    )
+    parser.add_argument(
+        "review",
+        nargs="?",
+        help=f"path to the review file (default: newest {REVIEW_FILENAME})",
+    )
+    parser.add_argument(
+        "--autosave-every",
+        type=int,
+        default=10,
+        metavar="N",
+        help="persist progress every N actions (0: only on exit; default 10)",
+    )
+    args = parser.parse_args(argv)
+
+    repo_root = find_repo_root()
+    if args.review:
+        review_path = Path(args.review)
+    else:
+        review_path = find_latest_review(repo_root)
+    if review_path is None or not review_path.is_file():
+        print(f"No {REVIEW_FILENAME} found. Commit once to generate a review.")
+        return 1
+
+    review_text = review_path.read_text(encoding="utf-8", errors="replace")
+    findings = parse_bad_findings(review_text)
+    if not findings:
+        print("No BAD findings in the review. Nothing to do.")
+        return 0
+
+    state_path = state_path_for(review_path)
+    state = load_state(state_path)
+    ensure_state_for_findings(state, findings)
+    save_state(state_path, state)
+
+    print(f"Review: {review_path}")
+    print(f"{len(findings)} BAD finding(s) to triage.")
+    print(HELP_TEXT)
+    interactive_loop(
+        findings, state, state_path, repo_root, autosave_every=args.autosave_every
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Non-interactive companion for auto_code_review.md reports.
+
+Parses the review written by the pre-commit hook into ReviewAssessment
+objects, prints a readable summary of the BAD findings, and with --fix hands
+each finding to the Gemini/Cursor CLI together with the current git diff of
+the affected file. The parsing half is importable for other tooling.
+
+Usage:
+    python3 interactive_review_helper.py [path/to/auto_code_review.md] [--fix]
+"""
+
+from __future__ import annotations
+
+import functools
+import io
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# The review-format regexes and parser are shared with the other tooling via
+# review_parsing so each pattern is compiled once per process.
+from review_parsing import (  # noqa: F401  (re-exported for importers)
+    ASSESSMENT_HEADER_RE,
+    FIELD_RE,
+    ReviewAssessment,
+    parse_review_file,
+)
+
+REVIEW_FILENAME = "auto_code_review.md"
+
+
+def _print_section(title: str, body: str) -> None:
+    # One buffered write instead of four print flushes.
+    sys.stdout.write(f"{title}\n{'-' * len(title)}\n{body}\n\n")
+
+
+def display_assessment(index: int, total: int, assessment: ReviewAssessment) -> None:
+    header = f"[{index}/{total}] [{assessment.rating}] {assessment.title or '(untitled)'}"
+    divider = "=" * len(header)
+    out = [f"\n{divider}\n{header}\n{divider}\n"]
+    for label, value in (
+        ("file", assessment.file),
+        ("function", assessment.function),
+        ("lines", assessment.lines),
+    ):
+        if value:
+            out.append(f"{label}: {value}\n")
+    out.append("\n")
+    sys.stdout.write("".join(out))
+    if assessment.details:
+        _print_section("Details", assessment.details)
+    if assessment.suggestion:
+        _print_section("Suggestion", assessment.suggestion)
+    if assessment.reasoning:
+        _print_section("Reasoning", assessment.reasoning)
+
+
+def detect_repo_root() -> Path:
+    """Return the git repository root, falling back to the current directory."""
+    import subprocess
+
+    result = subprocess.run(
+        ["git", "rev-parse", "--show-toplevel"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode == 0 and result.stdout.strip():
+        return Path(result.stdout.strip())
+    return Path.cwd()
+
+
+def collect_git_diff(repo_root: Path, file_path: str) -> Optional[str]:
+    """Return the uncommitted diff of *file_path*, or None when empty."""
+    # Reviews sometimes emit paths like foo.py:42-55; strip the span and skip
+    # the fork+exec entirely when the file plainly is not there.
+    clean_path = file_path.split(":", 1)[0]
+    if not (repo_root / clean_path).exists():
+        return None
+    import subprocess
+
+    result = subprocess.run(
+        ["git", "diff", "HEAD", "--no-color", "--", clean_path],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    return result.stdout
+
+
+def build_prompt(
+    assessment: ReviewAssessment,
+    repo_root: Path,
+    review_path: Path,
+    file_diff: Optional[str] = None,
+) -> str:
+    """Build the prompt handed to the AI CLI for one finding."""
+    buf = io.StringIO()
+    write = buf.write
+    write("You are helping to resolve a code review finding.\n")
+    write(f"Work within the repository located at: {repo_root}\n")
+    write(f"The finding below comes from the review file: {review_path}\n\n")
+    details = [
+        ("File", assessment.file),
+        ("Function", assessment.function),
+        ("Lines", assessment.lines),
+        ("Details", assessment.details),
+        ("Suggestion", assessment.suggestion),
+        ("Reasoning", assessment.reasoning),
+    ]
+    for label, value in details:
+        if value:
+            write(f"{label}: {value}\n")
+    if assessment.file:
+        write(f"\nStart from the file: {assessment.file}\n")
+        write(f"Only touch code related to: {assessment.file}\n")
+    if file_diff:
+        write(f"\nCurrent uncommitted diff for context:\n```diff\n{file_diff.rstrip()}\n```\n")
+    write("\nApply the smallest fix that resolves the finding, then summarize the edit.")
+    return buf.getvalue()
+
+
+@functools.lru_cache(maxsize=8)
+def _which(name: str) -> Optional[str]:
+    """shutil.which with session-scoped caching; PATH probes are not free."""
+    import shutil
+
+    return shutil.which(name)
+
+
+def prepare_command(args: "argparse.Namespace") -> Optional[Tuple[List[str], bool]]:
+    """Choose the AI CLI invocation; returns (command, use_stdin) or None.
+
+    A custom --command-template may reference {prompt_file}; otherwise the
+    prompt is piped on stdin.
+    """
+    if args.command_template:
+        import shlex
+
+        command = shlex.split(args.command_template)
+        use_stdin = "{prompt_file}" not in args.command_template
+        return command, use_stdin
+    if _which(args.gemini_executable):
+        return (
+            [
+                args.gemini_executable,
+                "--approval-mode",
+                "auto_edit",
+                "-m",
+                args.gemini_model,
+            ],
+            True,
+        )
+    if _which(args.cursor_executable):
+        return [args.cursor_executable, "-f", "--output-format", "text"], True
+    return None
+
+
+def run_ai_command(
+    command: List[str], use_stdin: bool, prompt: str, repo_root: Path
+) -> int:
+    """Run the AI CLI with the prompt; returns its exit code."""
+    import subprocess
+    import tempfile
+
+    if use_stdin:
+        # No tempfile round-trip: pipe the prompt straight to the child.
+        result = subprocess.run(
+            command, input=prompt, text=True, cwd=repo_root, check=False
+        )
+        return result.returncode
+    # Only command templates referencing {prompt_file} need the file on disk.
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".txt", prefix="review_prompt_", delete=False, encoding="utf-8"
+    ) as handle:
+        handle.write(prompt)
+        prompt_path = handle.name
+    try:
+        resolved = [part.replace("{prompt_file}", prompt_path) for part in command]
+        result = subprocess.run(resolved, cwd=repo_root, check=False)
+        return result.returncode
+    finally:
+        os.unlink(prompt_path)
+
+
+def build_arg_parser() -> "argparse.ArgumentParser":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Summarize auto_code_review.md and optionally hand BAD findings "
+            "to an AI CLI."
+        )
+    )
+    parser.add_argument(
+        "review",
+        nargs="?",
+        help=f"path to the review file (default: <repo root>/{REVIEW_FILENAME})",
+    )
+    parser.add_argument(
+        "--fix", action="store_true", help="run the AI CLI on each BAD finding"
+    )
+    parser.add_argument(
+        "--all", action="store_true", help="show GOOD/NEUTRAL assessments too"
+    )
+    parser.add_argument("--gemini-executable", default="gemini")
+    parser.add_argument("--gemini-model", default="gemini-2.5-pro")
+    parser.add_argument("--cursor-executable", default="cursor-agent")
+    parser.add_argument(
+        "--command-template",
+        default=None,
+        help=(
+            "custom AI command; {prompt_file} is replaced with the prompt "
+            "path, otherwise the prompt is piped to stdin"
+        ),
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    repo_root = detect_repo_root()
+    review_path = Path(args.review) if args.review else repo_root / REVIEW_FILENAME
+    if not review_path.is_file():
+        print(f"No review file found at {review_path}.")
+        return 1
+
+    # Filter at parse time: non-BAD blocks are skipped before any field work.
+    rating_filter = None if args.all else {"BAD"}
+    with review_path.open("r", encoding="utf-8", errors="replace") as handle:
+        shown = parse_review_file(handle, rating_filter)
+    if not shown:
+        print("No BAD findings in the review. Nothing to do.")
+        return 0
+
+    total = len(shown)
+    for index, assessment in enumerate(shown, 1):
+        display_assessment(index, total, assessment)
+        if args.fix and assessment.rating == "BAD":
+            prepared = prepare_command(args)
+            if prepared is None:
+                print("No supported AI CLI found (gemini, cursor-agent).")
+                return 1
+            command, use_stdin = prepared
+            file_diff = (
+                collect_git_diff(repo_root, assessment.file)
+                if assessment.file
+                else None
+            )
+            prompt = build_prompt(assessment, repo_root, review_path, file_diff)
+            return_code = run_ai_command(command, use_stdin, prompt, repo_root)
+            if return_code != 0:
+                print(f"AI CLI exited with {return_code}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""Validate and normalize the patch suggestions in auto_code_review.md.
+
+Meant to run after the hook finishes a review: for each BAD finding the
+script extracts the fenced diff suggestion, normalizes it into something
+``git apply`` can parse, checks it against the working tree with
+``git apply --check``, and rewrites the suggestion block with either the
+cleaned patch or a "(no auto-applicable patch)" marker so later tooling
+(and readers) can trust what is left in the report.
+
+Usage:
+    python3 postprocess_review.py [path/to/auto_code_review.md]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import os
+import re
+import shutil
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+REVIEW_FILENAME = "auto_code_review.md"
+NO_PATCH_MARKER = "(no auto-applicable patch)"
+
+# Resolved once; every git invocation skips the per-call PATH search.
+_GIT = shutil.which("git") or "git"
+
+# Compiled once at import; these run per finding on every postprocess pass.
+# One pattern finds the BAD blocks directly: it anchors on the assessment
+# header (which only appears inside the Change-by-Change section) and stops
+# at the --- separator, the next assessment, or the next section, so no
+# separate section search is needed. The separator alternative requires the
+# end of line so diff headers like "--- a/file" inside fences do not match.
+_BAD_BLOCK_RE = re.compile(
+    r"### Assessment of the change:\s*BAD[^\n]*\n"
+    r"(?P<body>.*?)(?=\n---[ \t]*(?:\n|\Z)|\n### Assessment|\n## |\Z)",
+    re.S,
+)
+_FENCE_RE = re.compile(r"```(?:diff|patch|suggestion)?\n(.*?)```", re.S)
+SUGGESTION_PATTERN = re.compile(r"\*\*Suggestion[^:*]*:?\*\*")
+# Locates every **label:** at a line start in one multiline pass; the value
+# is whatever sits between a label and the next one.
+_LABEL_RE = re.compile(r"^\*\*([^*\n]+?)\*\*:?[ \t]*", re.M)
+
+
+@dataclass
+class Finding:
+    """One BAD assessment block, as sliced out of the review text."""
+
+    grade: str
+    fields: Dict[str, str]
+    raw_block: str
+    # Offsets of raw_block within the review text, straight from match.span();
+    # the rewrite splices by these instead of re-searching for the block.
+    raw_span: Tuple[int, int]
+
+    @property
+    def file(self) -> str:
+        return self.fields.get("file", "")
+
+    @property
+    def title(self) -> str:
+        return self.fields.get("title", "")
+
+    @property
+    def suggestion(self) -> str:
+        return self.fields.get("suggestion", "")
+
+
+def _canonical_label(raw: str) -> str:
+    """``Suggestion (if 'BAD')`` -> ``suggestion``."""
+    label = raw.strip().rstrip(":").lower()
+    label = label.partition("(")[0].strip()
+    return label
+
+
+def _clean_field_value(value: str) -> str:
+    """Drop the hard-break backslashes and blank lines of a field value."""
+    parts = [
+        cleaned
+        for cleaned in (line.strip().rstrip("\\").rstrip() for line in value.splitlines())
+        if cleaned
+    ]
+    return "\n".join(parts)
+
+
+def parse_fields(block_body: str) -> Dict[str, str]:
+    """Parse the ``**label:** value`` lines of one assessment body.
+
+    One _LABEL_RE pass locates every label; each value is the slice between
+    a label and the next, so there is no Python-level line tokenizer.
+    """
+    matches = list(_LABEL_RE.finditer(block_body))
+    fields: Dict[str, str] = {}
+    for idx, match in enumerate(matches):
+        label = _canonical_label(match.group(1))
+        end = matches[idx + 1].start() if idx + 1 < len(matches) else len(block_body)
+        value = _clean_field_value(block_body[match.end() : end])
+        if label not in fields:
+            fields[label] = value
+        elif value:
+            fields[label] = f"{fields[label]}\n{value}" if fields[label] else value
+    return fields
+
+
+def parse_bad_findings(review_text: str) -> List[Finding]:
+    """Extract every BAD assessment block from the review report."""
+    findings: List[Finding] = []
+    for match in _BAD_BLOCK_RE.finditer(review_text):
+        findings.append(
+            Finding(
+                grade="BAD",
+                fields=parse_fields(match.group("body")),
+                raw_block=match.group(0),
+                raw_span=match.span(),
+            )
+        )
+    return findings
+
+
+def extract_patch(block: str) -> Optional[str]:
+    """Pull the first fenced diff/patch block out of a finding."""
+    match = _FENCE_RE.search(block)
+    if not match:
+        return None
+    patch = match.group(1)
+    return patch if patch.strip() else None
+
+
+def _marker_at(text: str, marker: str) -> int:
+    """Offset of the first line starting with *marker*, or -1."""
+    if text.startswith(marker):
+        return 0
+    pos = text.find("\n" + marker)
+    return -1 if pos == -1 else pos + 1
+
+
+def prepare_patch_for_application(patch_text: str) -> Optional[str]:
+    """Normalize a fenced suggestion into something git apply can parse.
+
+    Drops leading prose before the first diff header and requires file
+    headers plus at least one hunk; returns None when the text cannot be a
+    unified diff.
+    """
+    text = patch_text.strip("\n")
+    if not text:
+        return None
+    # One C-level find per marker, each computed exactly once and reused for
+    # both the presence check and the start offset.
+    old_idx = _marker_at(text, "--- ")
+    if old_idx == -1:
+        return None
+    if _marker_at(text, "+++ ") == -1 or _marker_at(text, "@@") == -1:
+        return None
+    diff_idx = _marker_at(text, "diff --git ")
+    start = old_idx if diff_idx == -1 else min(diff_idx, old_idx)
+    return text[start:] + "\n"
+
+
+@functools.lru_cache(maxsize=None)
+def find_repo_root(explicit: Optional[str] = None) -> Path:
+    """Return the git repository root, falling back to the current directory.
+
+    Memoized per *explicit* argument; the rev-parse subprocess runs at most
+    once per process.
+    """
+    if explicit:
+        return Path(explicit)
+    result = subprocess.run(
+        [_GIT, "rev-parse", "--show-toplevel"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode == 0 and result.stdout.strip():
+        return Path(result.stdout.strip())
+    return Path.cwd()
+
+
+def run_git_apply_check(repo_root: Path, patch: str) -> bool:
+    """Return True when *patch* applies cleanly to the working tree."""
+    result = subprocess.run(
+        [_GIT, "apply", "--check", "-"],
+        input=patch,
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return result.returncode == 0
+
+
+def run_git_apply_check_batch(repo_root: Path, patches: List[str]) -> List[bool]:
+    """Validate many patches with as few git invocations as possible.
+
+    git apply accepts a concatenated patch series on stdin, so the common
+    all-clean case costs one fork+exec total. Only when the combined check
+    fails (one bad patch, or overlapping hunks) does this fall back to
+    checking each patch on its own — concurrently, since the checks are
+    independent and the GIL is released while waiting on the children.
+    """
+    if not patches:
+        return []
+    if len(patches) == 1:
+        return [run_git_apply_check(repo_root, patches[0])]
+    if run_git_apply_check(repo_root, "".join(patches)):
+        return [True] * len(patches)
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = min(8, os.cpu_count() or 1, len(patches))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # map keeps the results in patch order.
+        return list(
+            executor.map(lambda patch: run_git_apply_check(repo_root, patch), patches)
+        )
+
+
+def format_diff_suggestion(patch_body: str) -> str:
+    """Wrap a validated patch back into a fenced diff block."""
+    if not patch_body.endswith("\n"):
+        patch_body += "\n"
+    return f"```diff\n{patch_body}```"
+
+
+def update_suggestion_block(
+    raw_block: str, prepared: Optional[str]
+) -> Optional[Tuple[str, str, str]]:
+    """Rewrite the fenced suggestion inside *raw_block*.
+
+    With a validated patch the fence content is replaced by it; with None a
+    marker is appended after the fence. Returns the rewritten block as a
+    (prefix, replacement, suffix) slice triple — the caller appends the
+    pieces straight to its output buffer, so no per-finding concatenation
+    ever happens — or None when there is nothing to change (no fence, or
+    the marker is already present).
+    """
+    match = _FENCE_RE.search(raw_block)
+    if not match:
+        return None
+    if prepared is None:
+        if NO_PATCH_MARKER in raw_block:
+            return None
+        end = match.end()
+        return raw_block[:end], f"\n{NO_PATCH_MARKER}", raw_block[end:]
+    return (
+        raw_block[: match.start()],
+        format_diff_suggestion(prepared),
+        raw_block[match.end() :],
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Validate the patch suggestions in auto_code_review.md."
+    )
+    parser.add_argument(
+        "review",
+        nargs="?",
+        help=f"path to the review file (default: <repo root>/{REVIEW_FILENAME})",
+    )
+    parser.add_argument("--repo-root", default=None)
+    args = parser.parse_args(argv)
+
+    repo_root = find_repo_root(args.repo_root)
+    review_path = Path(args.review) if args.review else repo_root / REVIEW_FILENAME
+    if not review_path.is_file():
+        print(f"No review file found at {review_path}.")
+        return 1
+
+    review_text = review_path.read_text(encoding="utf-8", errors="replace")
+    findings = parse_bad_findings(review_text)
+    if not findings:
+        print("No BAD findings; nothing to postprocess.")
+        return 0
+
+    # Classify every finding first so all candidate patches can go through
+    # one batched git apply --check instead of one subprocess per finding.
+    candidates: List[Tuple[Finding, Optional[str], bool]] = []
+    skipped = 0
+    for finding in findings:
+        # Cheap substring tests before the regex: findings already carrying
+        # the marker, or with no fence anywhere in the block, cannot yield a
+        # patch (checked on raw_block since a fence may sit outside the
+        # suggestion field).
+        if NO_PATCH_MARKER in finding.suggestion or "```" not in finding.raw_block:
+            skipped += 1
+            continue
+        patch = extract_patch(finding.raw_block)
+        if patch is None:
+            candidates.append((finding, None, True))
+        else:
+            candidates.append((finding, prepare_patch_for_application(patch), False))
+
+    to_check = [prepared for _, prepared, _ in candidates if prepared is not None]
+    check_results = iter(run_git_apply_check_batch(repo_root, to_check))
+
+    # (start, end, block slices) splice entries; the offsets come from the
+    # parse itself, so no replacement ever re-searches the review text.
+    replacements: List[Tuple[int, int, Tuple[str, str, str]]] = []
+    valid = invalid = 0
+    for finding, prepared, fence_missing in candidates:
+        if prepared is not None and next(check_results):
+            new_block = update_suggestion_block(finding.raw_block, prepared)
+            valid += 1
+        else:
+            new_block = update_suggestion_block(finding.raw_block, None)
+            if fence_missing:
+                skipped += 1
+            else:
+                invalid += 1
+        if new_block is None:
+            continue
+        start, end = finding.raw_span
+        replacements.append((start, end, new_block))
+
+    if replacements:
+        # One pass over the text: keep the untouched stretches, lay the
+        # rewritten blocks in as their raw slices, join once. The blocks are
+        # never concatenated on their own first.
+        replacements.sort()
+        pieces: List[str] = []
+        cursor = 0
+        for start, end, new_block in replacements:
+            pieces.append(review_text[cursor:start])
+            pieces.extend(new_block)
+            cursor = end
+        pieces.append(review_text[cursor:])
+        review_path.write_text("".join(pieces), encoding="utf-8")
+
+    print(
+        f"Checked {len(findings)} finding(s): "
+        f"{valid} applicable, {invalid} not applicable, {skipped} skipped."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Shared parsing primitives for auto_code_review.md reports.
+
+Both interactive_review.py and interactive_review_helper.py consume the
+review format the pre-commit hook emits; the regexes, markers and the
+line-oriented parser live here so the patterns are compiled exactly once
+per process regardless of which tool imports them.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set
+
+# The header/field patterns are anchored and backtracking-free, so they can
+# run on google-re2's linear-time engine when it is installed — faster on
+# large reviews and immune to pathological input. The substitution patterns
+# below stay on stdlib re, which re2 does not fully cover.
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
+ASSESSMENT_MARKER = "### Assessment of the change:"
+
+ASSESSMENT_HEADER_RE = _re.compile(
+    r"^###\s+Assessment of the change:\s*(?P<rating>[A-Za-z]+)"
+)
+FIELD_RE = _re.compile(r"^\*\*(?P<label>.+?):?\*\*:?\s*(?P<value>.*)$")
+_PAREN_RE = re.compile(r"\(.*?\)")
+_NONALNUM_RE = re.compile(r"[^a-z0-9]+")
+_TRAIL_WS_RE = re.compile(r"[ \t]+(?=\n|$)")
+
+
+@dataclass(slots=True)
+class ReviewAssessment:
+    """One assessment block (of any rating) from the review report.
+
+    The common field values are resolved once at construction; consumers read
+    plain attributes instead of re-hashing the fields dict per access.
+    """
+
+    rating: str
+    fields: Dict[str, str]
+    raw_markdown: str
+    title: str = ""
+    file: str = ""
+    function: str = ""
+    lines: str = ""
+    details: str = ""
+    suggestion: str = ""
+    reasoning: str = ""
+
+
+def _normalise_key(raw: str) -> str:
+    """``Suggestion (if 'BAD')`` -> ``suggestion``."""
+    return _NONALNUM_RE.sub("_", _PAREN_RE.sub("", raw.lower())).strip("_")
+
+
+def _clean_markdown_value(value: str) -> str:
+    """Drop trailing whitespace the report's hard line-breaks leave behind."""
+    return _TRAIL_WS_RE.sub("", value).strip()
+
+
+def _build_assessment(rating: str, lines: List[str]) -> ReviewAssessment:
+    """Assemble one ReviewAssessment from the lines of its block."""
+    # The caller already holds the block as a list; join it once instead of
+    # re-accumulating every line into a second list.
+    raw_markdown = "\n".join(lines).strip()
+    # Lists of fragments joined once at the end; string += per line is O(n^2)
+    # on long detail/reasoning fields.
+    field_buffers: Dict[str, List[str]] = {}
+    # Fields holding a ``` fence skip the markdown cleanup: a suggested
+    # diff's context-line spaces, indentation and blank lines are
+    # significant, and stripping them corrupts the patch.
+    fenced_keys: Set[str] = set()
+    current_key: Optional[str] = None
+    in_fence = False
+    for raw_line in lines:
+        if in_fence:
+            if current_key is not None:
+                field_buffers[current_key].append(raw_line)
+            if raw_line.strip().startswith("```"):
+                in_fence = False
+            continue
+        # isspace is a C-level scan; blank lines (~30% of a report) skip the
+        # strip allocation entirely.
+        if not raw_line or raw_line.isspace():
+            if current_key is not None:
+                field_buffers[current_key].append("")
+            continue
+        stripped = raw_line.strip()
+        if stripped.startswith("```"):
+            in_fence = True
+            if current_key is not None:
+                field_buffers[current_key].append(stripped.rstrip("\\").rstrip())
+                fenced_keys.add(current_key)
+            continue
+        field_match = FIELD_RE.match(stripped) if stripped.startswith("**") else None
+        if field_match:
+            current_key = _normalise_key(field_match.group("label"))
+            field_buffers[current_key] = [
+                field_match.group("value").strip().rstrip("\\").rstrip()
+            ]
+        elif current_key is not None:
+            field_buffers[current_key].append(stripped.rstrip("\\").rstrip())
+    cleaned = {
+        key: (
+            "\n".join(buffer).strip("\n")
+            if key in fenced_keys
+            else _clean_markdown_value("\n".join(buffer))
+        )
+        for key, buffer in field_buffers.items()
+    }
+    get = cleaned.get
+    return ReviewAssessment(
+        rating=rating,
+        fields=cleaned,
+        raw_markdown=raw_markdown,
+        title=get("title", ""),
+        file=get("file", ""),
+        function=get("function", ""),
+        lines=get("lines", ""),
+        details=get("details", ""),
+        suggestion=get("suggestion") or get("suggestion_if_bad", ""),
+        reasoning=get("reasoning") or get("reasoning_if_bad", ""),
+    )
+
+
+def parse_review_file(
+    lines: Iterable[str], rating_filter: Optional[Set[str]] = None
+) -> List[ReviewAssessment]:
+    """Parse review lines into a list of assessments, in order.
+
+    Accepts any iterable of lines — typically an open file handle, so the
+    whole review never has to be materialized as one string plus a line list.
+    Trailing newlines are stripped here. When *rating_filter* is given,
+    blocks with other ratings are skipped without accumulating their lines
+    or building an assessment.
+    """
+    assessments: List[ReviewAssessment] = []
+    current_rating: Optional[str] = None
+    current_lines: List[str] = []
+    for raw in lines:
+        line = raw.rstrip("\n")
+        # The vast majority of lines cannot be headers; skip the regex engine
+        # for them entirely.
+        if line.startswith("### ") or line.startswith("###\t"):
+            header_match = ASSESSMENT_HEADER_RE.match(line)
+        else:
+            header_match = None
+        if header_match:
+            if current_rating is not None:
+                assessments.append(_build_assessment(current_rating, current_lines))
+            rating = header_match.group("rating").upper()
+            if rating_filter is not None and rating not in rating_filter:
+                current_rating = None
+            else:
+                current_rating = rating
+            current_lines = []
+            continue
+        if current_rating is not None and (
+            line.strip() == "---" or line.startswith("## ")
+        ):
+            assessments.append(_build_assessment(current_rating, current_lines))
+            current_rating = None
+            current_lines = []
+            continue
+        if current_rating is not None:
+            current_lines.append(line)
+    if current_rating is not None:
+        assessments.append(_build_assessment(current_rating, current_lines))
+    return assessments
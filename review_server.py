@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""Live browser viewer for auto_code_review.md reports.
+
+Serves a small dashboard that shows the review the pre-commit hook wrote
+and refreshes it the moment the file changes: each open page holds an SSE
+(Server-Sent Events) connection to /stream, a ReviewWatcher thread polls
+the file's mtime, and change notifications fan out to every subscriber.
+Standard library only — no web framework required.
+
+Usage:
+    python3 review_server.py [--host 127.0.0.1] [--port 8765]
+
+Endpoints:
+    /                   the viewer page (``?dir=sub/project`` to pick a tree)
+    /api/review?dir=…   review text plus its modification time, as JSON
+    /stream?dir=…       SSE feed of mtime changes for the review file
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# orjson is optional, as elsewhere in this tooling: its C encoder beats the
+# stdlib by several times on these small payloads, and the fallback emits the
+# same compact form.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# watchdog (inotify/kqueue under the hood) is optional: with it installed
+# changes reach the browser in milliseconds with zero polling wake-ups;
+# without it the watcher falls back to the mtime polling loop.
+try:
+    from watchdog.events import FileSystemEventHandler as _FSEventHandler
+    from watchdog.observers import Observer as _Observer
+except ImportError:
+    _FSEventHandler = object
+    _Observer = None
+
+REVIEW_FILENAME = "auto_code_review.md"
+DEFAULT_POLL_INTERVAL = 1.0
+KEEPALIVE_SECONDS = 15.0
+
+# Resolved once at import; request handlers must not pay the resolve()
+# syscalls on every hit.
+BASE_DIR = Path(__file__).resolve().parent
+STATIC_DIR = BASE_DIR / "static"
+
+
+@functools.lru_cache(maxsize=128)
+def format_timestamp(mtime_ns: Optional[int]) -> Optional[str]:
+    """Render an st_mtime_ns value as a local ISO timestamp.
+
+    Cached by the integer mtime: the same value is formatted for every
+    subscriber and every keepalive, and datetime construction is not free.
+    """
+    if mtime_ns is None:
+        return None
+    return datetime.fromtimestamp(mtime_ns / 1e9).isoformat(timespec="seconds")
+
+
+@dataclass
+class WatchPayload:
+    """One event on the SSE feed: init on connect, update on change."""
+
+    event: str
+    mtime_ns: Optional[int]
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "event": self.event,
+            "mtime_ns": self.mtime_ns,
+            "modified": format_timestamp(self.mtime_ns),
+        }
+
+    def as_sse_bytes(self) -> bytes:
+        """The wire form of this payload, built exactly once per event."""
+        return b"data: " + _dumps(self.as_dict()) + b"\n\n"
+
+
+class ReviewWatcher:
+    """Watches one review file and fans mtime changes out to subscribers."""
+
+    def __init__(
+        self, file_path: Path, interval: float = DEFAULT_POLL_INTERVAL
+    ) -> None:
+        self._file_path = file_path
+        # os.stat on the plain string per poll; Path.stat adds wrapper
+        # allocations that add up at sub-second intervals.
+        self._file_path_str = str(file_path)
+        self._interval = interval
+        self._subscribers: List["queue.Queue[bytes]"] = []
+        self._lock = threading.Lock()
+        self._last_mtime_ns = self._current_state()
+        _SERVICE.register(self)
+
+    @property
+    def last_mtime_ns(self) -> Optional[int]:
+        return self._last_mtime_ns
+
+    def _current_state(self) -> Optional[int]:
+        try:
+            return os.stat(self._file_path_str).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def subscribe(self) -> "queue.Queue[bytes]":
+        # Bounded so a stalled SSE client cannot pin memory; _broadcast
+        # coalesces on overflow since only the latest state matters.
+        subscriber: "queue.Queue[bytes]" = queue.Queue(maxsize=16)
+        with self._lock:
+            self._subscribers.append(subscriber)
+        subscriber.put(WatchPayload("init", self._last_mtime_ns).as_sse_bytes())
+        return subscriber
+
+    def unsubscribe(self, subscriber: "queue.Queue[bytes]") -> None:
+        with self._lock:
+            try:
+                self._subscribers.remove(subscriber)
+            except ValueError:
+                pass
+
+    def _broadcast(self, payload: WatchPayload) -> None:
+        # Serialize once; every subscriber gets the same bytes object, so a
+        # change costs one json.dumps regardless of how many pages are open.
+        data = payload.as_sse_bytes()
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(data)
+            except queue.Full:
+                # The client is not draining; stale events are worthless, so
+                # drop the backlog and keep only the newest state.
+                with subscriber.mutex:
+                    subscriber.queue.clear()
+                subscriber.put_nowait(data)
+
+    def _check_for_change(self) -> None:
+        state = self._current_state()
+        if state != self._last_mtime_ns:
+            self._last_mtime_ns = state
+            self._broadcast(WatchPayload("update", state))
+
+
+class _WatcherService:
+    """One background watcher for every file, instead of a thread per file.
+
+    Event-capable setups share a single watchdog Observer; everything else
+    lands in one polling thread that stats all registered files per tick.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._polled: Dict[str, ReviewWatcher] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._observer = None
+
+    def register(self, watcher: ReviewWatcher) -> None:
+        with self._lock:
+            if _Observer is not None and watcher._file_path.parent.is_dir():
+                if self._observer is None:
+                    observer = _Observer(timeout=DEFAULT_POLL_INTERVAL)
+                    observer.daemon = True
+                    observer.start()
+                    self._observer = observer
+                self._observer.schedule(
+                    _ReviewFileEventHandler(watcher), str(watcher._file_path.parent)
+                )
+                return
+            self._polled[watcher._file_path_str] = watcher
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, daemon=True, name="review-watch"
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                watchers = list(self._polled.values())
+            time.sleep(
+                min((w._interval for w in watchers), default=DEFAULT_POLL_INTERVAL)
+            )
+            for watcher in watchers:
+                watcher._check_for_change()
+
+
+_SERVICE = _WatcherService()
+
+
+class _ReviewFileEventHandler(_FSEventHandler):
+    """Forwards watchdog events for the review file to its watcher."""
+
+    def __init__(self, watcher: ReviewWatcher) -> None:
+        self._watcher = watcher
+
+    def on_any_event(self, event: object) -> None:
+        # Moves/atomic replaces report the file as dest_path, plain writes as
+        # src_path; either way only the watched file is interesting.
+        if self._watcher._file_path_str in (
+            getattr(event, "src_path", None),
+            getattr(event, "dest_path", None),
+        ):
+            self._watcher._check_for_change()
+
+
+_watchers: Dict[str, ReviewWatcher] = {}
+_watchers_lock = threading.Lock()
+
+
+def get_watcher(file_path: Path) -> ReviewWatcher:
+    """Return the (shared) watcher for *file_path*, creating it on first use."""
+    key = str(file_path)
+    with _watchers_lock:
+        watcher = _watchers.get(key)
+        if watcher is None:
+            watcher = _watchers[key] = ReviewWatcher(file_path)
+        return watcher
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_uncached(raw_directory: str) -> Tuple[Path, Path]:
+    directory = (BASE_DIR / raw_directory).resolve() if raw_directory else BASE_DIR
+    if directory != BASE_DIR and BASE_DIR not in directory.parents:
+        raise ValueError("directory escapes the served tree")
+    if not directory.is_dir():
+        raise ValueError(f"not a directory: {raw_directory or '.'}")
+    return directory, directory / REVIEW_FILENAME
+
+
+def resolve_review_file(raw_directory: str) -> Tuple[Path, Path]:
+    """Map a ?dir= value onto a directory under the served tree.
+
+    Returns (directory, review_file). Raises ValueError for paths that
+    escape the tree or do not exist. Successful resolutions are cached —
+    every /api/review hit and SSE keepalive re-resolved the same handful of
+    directories — while failures are re-validated each time (lru_cache does
+    not cache exceptions), so a directory created later is picked up.
+    """
+    return _resolve_uncached(raw_directory)
+
+
+def generate_file_chunks(file_path: Path, chunk_size: int = 64 * 1024):
+    """Yield the file's text in bounded chunks; peak memory stays O(chunk)."""
+    with open(file_path, "r", encoding="utf-8", errors="replace") as handle:
+        while True:
+            chunk = handle.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+class ReviewRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802  (http.server API)
+        parsed = urlparse(self.path)
+        raw_dir = parse_qs(parsed.query).get("dir", [""])[0]
+        if parsed.path == "/":
+            self._serve_index()
+        elif parsed.path == "/api/review":
+            self._serve_review(raw_dir)
+        elif parsed.path == "/api/review/raw":
+            self._serve_review_raw(raw_dir)
+        elif parsed.path == "/stream":
+            self._serve_stream(raw_dir)
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "unknown endpoint"})
+
+    def _send_json(self, status: HTTPStatus, obj: Dict[str, object]) -> None:
+        body = json.dumps(obj).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _serve_index(self) -> None:
+        try:
+            body = (STATIC_DIR / "index.html").read_bytes()
+        except OSError:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "viewer page missing"})
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _serve_review(self, raw_dir: str) -> None:
+        try:
+            directory, review_file = resolve_review_file(raw_dir)
+        except ValueError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+            return
+        watcher = get_watcher(review_file)
+        if not review_file.is_file():
+            self._send_json(
+                HTTPStatus.OK,
+                {"directory": str(directory), "modified": None, "text": None},
+            )
+            return
+        # Stream the envelope: metadata prefix, then the file in bounded
+        # chunks escaped one at a time. The whole review is never held in
+        # memory, let alone twice (raw + JSON-escaped).
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        try:
+            prefix = (
+                '{"directory": %s, "modified": %s, "text": "'
+                % (
+                    json.dumps(str(directory)),
+                    json.dumps(format_timestamp(watcher.last_mtime_ns)),
+                )
+            )
+            self.wfile.write(prefix.encode("utf-8"))
+            for chunk in generate_file_chunks(review_file):
+                # dumps then strip the surrounding quotes: escaping is
+                # per-character, so chunk boundaries are safe.
+                self.wfile.write(json.dumps(chunk)[1:-1].encode("utf-8"))
+            self.wfile.write(b'"}')
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _serve_review_raw(self, raw_dir: str) -> None:
+        try:
+            _, review_file = resolve_review_file(raw_dir)
+        except ValueError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+            return
+        if not review_file.is_file():
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "no review file yet"})
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/markdown; charset=utf-8")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        try:
+            for chunk in generate_file_chunks(review_file):
+                self.wfile.write(chunk.encode("utf-8"))
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _serve_stream(self, raw_dir: str) -> None:
+        try:
+            _, review_file = resolve_review_file(raw_dir)
+        except ValueError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+            return
+        watcher = get_watcher(review_file)
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        try:
+            for chunk in self.stream_updates(watcher):
+                self.wfile.write(chunk)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def stream_updates(self, watcher: ReviewWatcher):
+        """SSE byte chunks for one subscriber, ending when the client drops."""
+        subscriber = watcher.subscribe()
+
+        def generate():
+            try:
+                while True:
+                    try:
+                        data = subscriber.get(timeout=KEEPALIVE_SECONDS)
+                    except queue.Empty:
+                        data = WatchPayload(
+                            "keepalive", watcher.last_mtime_ns
+                        ).as_sse_bytes()
+                    yield data
+            finally:
+                watcher.unsubscribe(subscriber)
+
+        return generate()
+
+    def log_message(self, format: str, *args: object) -> None:
+        # Keepalive-driven SSE chatter would swamp the console; log errors only.
+        if not self.path.startswith("/stream"):
+            super().log_message(format, *args)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Serve a live viewer for auto_code_review.md."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    server = ThreadingHTTPServer((args.host, args.port), ReviewRequestHandler)
+    print(f"Serving review viewer on http://{args.host}:{args.port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping.")
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())